@@ -52,7 +52,10 @@ void setup() {
   moveToHome();
   
   Serial.println("Folding Laundry Robot - Ready");
-  Serial.println("Commands: h=home, o=open gripper, c=close gripper, m=manual mode");
+  Serial.println("Commands: h=home, o=open gripper, c=close gripper, m=manual mode, P=pose frame");
+  
+  // Readiness handshake; the host waits for this line after connecting
+  Serial.println("READY");
 }
 
 void loop() {
@@ -79,6 +82,15 @@ void loop() {
         manualMode();
         break;
         
+      case 'P':
+        moveToPose();
+        break;
+        
+      case '\n':
+      case '\r':
+        // Ignore frame terminators
+        break;
+        
       default:
         Serial.println("Unknown command");
         break;
@@ -131,6 +143,53 @@ void moveServo(Servo &servo, int currentPos, int targetPos, int minLimit, int ma
   servo.write(targetPos);
 }
 
+void moveToPose() {
+  // Pose frame: 'P' followed by one byte per joint (base, shoulder,
+  // elbow, wrist, gripper) and a trailing newline
+  byte angles[6];
+  if (Serial.readBytes(angles, 6) != 6) {
+    Serial.println("ERROR: Incomplete pose frame");
+    return;
+  }
+  
+  // Angle bytes can look like commands or terminators (a gripper angle of
+  // 10 is '\n'), so check the trailing byte and drop anything left over
+  // rather than run it as commands
+  if (angles[5] != '\n') {
+    while (Serial.available()) {
+      Serial.read();
+    }
+    Serial.println("ERROR: Bad pose frame terminator");
+    return;
+  }
+  
+  if (angles[0] < BASE_MIN || angles[0] > BASE_MAX ||
+      angles[1] < SHOULDER_MIN || angles[1] > SHOULDER_MAX ||
+      angles[2] < ELBOW_MIN || angles[2] > ELBOW_MAX ||
+      angles[3] < WRIST_MIN || angles[3] > WRIST_MAX ||
+      angles[4] < GRIPPER_MIN || angles[4] > GRIPPER_MAX) {
+    Serial.println("ERROR: Pose out of range");
+    return;
+  }
+  
+  moveServo(baseServo, currentBase, angles[0], BASE_MIN, BASE_MAX);
+  currentBase = angles[0];
+  
+  moveServo(shoulderServo, currentShoulder, angles[1], SHOULDER_MIN, SHOULDER_MAX);
+  currentShoulder = angles[1];
+  
+  moveServo(elbowServo, currentElbow, angles[2], ELBOW_MIN, ELBOW_MAX);
+  currentElbow = angles[2];
+  
+  moveServo(wristServo, currentWrist, angles[3], WRIST_MIN, WRIST_MAX);
+  currentWrist = angles[3];
+  
+  moveServo(gripperServo, currentGripper, angles[4], GRIPPER_MIN, GRIPPER_MAX);
+  currentGripper = angles[4];
+  
+  Serial.println("Pose set");
+}
+
 void manualMode() {
   Serial.println("Manual mode - Enter servo angles (b,s,e,w,g followed by angle)");
   Serial.println("Example: 'b90' sets base to 90 degrees. 'x' to exit.");
@@ -139,6 +198,11 @@ void manualMode() {
     if (Serial.available() > 0) {
       char servoId = Serial.read();
       
+      if (servoId == '\n' || servoId == '\r') {
+        // Skip line terminators between commands
+        continue;
+      }
+      
       if (servoId == 'x') {
         Serial.println("Exiting manual mode");
         break;
@@ -3,15 +3,20 @@ Pose Definitions Module
 Defines standard poses for the folding laundry robot
 """
 
-from dataclasses import dataclass
-from typing import Dict
+import struct
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, NamedTuple, Tuple
 
 
-@dataclass
-class Pose:
+# Joint order used by pose tables and the serial protocol
+JOINT_NAMES = ("base", "shoulder", "elbow", "wrist", "gripper")
+
+
+class Pose(NamedTuple):
     """
     Represents a robot arm pose with joint angles.
-    All angles are in degrees.
+    All angles are in degrees. Poses are immutable and hashable.
     """
     name: str
     base: int        # Base rotation (0-180)
@@ -25,6 +30,41 @@ class Pose:
                 f"base={self.base}, shoulder={self.shoulder}, "
                 f"elbow={self.elbow}, wrist={self.wrist}, "
                 f"gripper={self.gripper}")
+    
+    # Joint angles as a row in JOINT_NAMES order. A C-level getter, since
+    # the safety checks read it on every call.
+    joints = property(itemgetter(slice(1, None)),
+                      doc="Joint angles as a row in JOINT_NAMES order.")
+    
+    @property
+    def payload(self) -> bytes:
+        """Serial pose frame: 'P', one byte per joint, newline."""
+        return encode_pose(self)
+
+
+# Firmware moves one servo at a time, one degree per step
+SERVO_STEP_DELAY = 0.015  # seconds, matches delay(15) in early_prototype.ino
+
+# Longest any pose move can take: every servo across its full 0-180° travel.
+# Used as the reply timeout, since a move's real length depends on where
+# the firmware's servos are, which the host does not always know.
+MAX_SETTLE_TIME = len(JOINT_NAMES) * 180 * SERVO_STEP_DELAY
+
+
+@lru_cache(maxsize=None)
+def encode_pose(pose: Pose) -> bytes:
+    """
+    Encode a pose as a serial pose frame.
+    Results are cached, so each pose is only packed once.
+    Angles are rounded to whole degrees, the firmware's resolution.
+    
+    Args:
+        pose: Pose to encode
+        
+    Returns:
+        Frame bytes: 'P', one byte per joint, newline
+    """
+    return struct.pack('<6B', ord('P'), *map(round, pose.joints)) + b'\n'
 
 
 # Standard poses for folding operations
@@ -123,6 +163,13 @@ ALL_POSES: Dict[str, Pose] = {
     "rest": POSE_REST,
 }
 
+# Joint table with one row per pose, built once at import.
+# POSE_INDEX maps a pose name to its row in POSE_TABLE.
+POSE_TABLE: Tuple[Tuple[int, int, int, int, int], ...] = tuple(
+    pose.joints for pose in ALL_POSES.values()
+)
+POSE_INDEX: Dict[str, int] = {name: row for row, name in enumerate(ALL_POSES)}
+
 
 def get_pose(name: str) -> Pose:
     """
@@ -137,9 +184,10 @@ def get_pose(name: str) -> Pose:
     Raises:
         KeyError: If pose name not found
     """
-    if name not in ALL_POSES:
+    pose = ALL_POSES.get(name)
+    if pose is None:
         raise KeyError(f"Pose '{name}' not found. Available poses: {list(ALL_POSES.keys())}")
-    return ALL_POSES[name]
+    return pose
 
 
 def list_poses() -> list:
@@ -152,8 +200,21 @@ def list_poses() -> list:
     return list(ALL_POSES.keys())
 
 
+def sequence_table(sequence) -> list:
+    """
+    Get the joint rows for a sequence of poses.
+    
+    Args:
+        sequence: Iterable of Pose objects
+        
+    Returns:
+        List of joint tuples, one per pose
+    """
+    return [pose.joints for pose in sequence]
+
+
 # Predefined folding sequences
-SEQUENCE_TOWEL_FOLD = [
+SEQUENCE_TOWEL_FOLD: Tuple[Pose, ...] = (
     POSE_HOME,
     POSE_PICKUP,
     POSE_GRIP,
@@ -163,9 +224,9 @@ SEQUENCE_TOWEL_FOLD = [
     POSE_FOLD_END,
     POSE_PLACE,
     POSE_HOME,
-]
+)
 
-SEQUENCE_SHIRT_FOLD = [
+SEQUENCE_SHIRT_FOLD: Tuple[Pose, ...] = (
     POSE_HOME,
     POSE_PICKUP,
     POSE_GRIP,
@@ -176,7 +237,7 @@ SEQUENCE_SHIRT_FOLD = [
     POSE_FOLD_END,
     POSE_PLACE,
     POSE_HOME,
-]
+)
 
 
 if __name__ == "__main__":
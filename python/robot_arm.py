@@ -6,7 +6,8 @@ Controls the robotic arm for folding laundry operations
 import serial
 import time
 from typing import Tuple, Optional
-from poses import Pose, POSE_HOME, POSE_PICKUP, POSE_FOLD_START
+from poses import (Pose, POSE_HOME, POSE_PICKUP, POSE_FOLD_START,
+                   MAX_SETTLE_TIME)
 from safety import SafetyChecker
 
 
@@ -16,16 +17,28 @@ class RobotArm:
     Communicates with Arduino hardware via serial connection.
     """
     
-    def __init__(self, port: str = '/dev/ttyUSB0', baudrate: int = 9600):
+    # Serial read timeouts (seconds)
+    COMMAND_TIMEOUT = 0.2  # Reply to a single command
+    READY_TIMEOUT = 3      # READY banner after the board resets
+    POSE_TIMEOUT = MAX_SETTLE_TIME + COMMAND_TIMEOUT  # 'P' frame reply
+    
+    def __init__(self, port: str = '/dev/ttyUSB0', baudrate: int = 9600,
+                 vector_mode: bool = False, reset_wait: bool = True):
         """
         Initialize robot arm controller.
         
         Args:
             port: Serial port for Arduino connection
             baudrate: Serial communication baud rate
+            vector_mode: Send each pose as a single 'P' frame
+                (requires firmware with pose frame support)
+            reset_wait: Wait for the firmware's READY banner on connect;
+                disable for boards that do not reset or print the banner
         """
         self.port = port
         self.baudrate = baudrate
+        self.vector_mode = vector_mode
+        self.reset_wait = reset_wait
         self.serial_conn: Optional[serial.Serial] = None
         self.safety_checker = SafetyChecker()
         self.current_pose: Optional[Pose] = None
@@ -39,8 +52,15 @@ class RobotArm:
             True if connection successful, False otherwise
         """
         try:
-            self.serial_conn = serial.Serial(self.port, self.baudrate, timeout=1)
-            time.sleep(2)  # Wait for Arduino to reset
+            self.serial_conn = serial.Serial(self.port, self.baudrate,
+                                             timeout=self.READY_TIMEOUT)
+            if self.reset_wait:
+                # Opening the port resets the Arduino; setup() prints READY
+                # last, so this returns as soon as the board is up
+                banner = self.serial_conn.read_until(b'READY')
+                if not banner.endswith(b'READY'):
+                    print("Warning: No READY banner from robot arm")
+            self.serial_conn.timeout = self.COMMAND_TIMEOUT
             self.is_connected = True
             print(f"Connected to robot arm on {self.port}")
             
@@ -68,20 +88,18 @@ class RobotArm:
             command: Single character command
             
         Returns:
-            Response from Arduino
+            First line of the response from Arduino
         """
         if not self.is_connected or not self.serial_conn:
             raise RuntimeError("Not connected to robot arm")
         
-        self.serial_conn.write(command.encode())
-        time.sleep(0.1)
-        
-        response = ""
-        while self.serial_conn.in_waiting > 0:
-            response += self.serial_conn.read(self.serial_conn.in_waiting).decode()
-            time.sleep(0.1)
+        # Drop stale replies so the line read belongs to this command
+        self.serial_conn.reset_input_buffer()
+        self.serial_conn.write(command.encode() + b'\n')
         
-        return response.strip()
+        # Replies are newline terminated; blocks until one arrives or timeout
+        response = self.serial_conn.read_until(b'\n', size=256)
+        return response.decode(errors='replace').strip()
     
     def move_to_pose(self, pose: Pose) -> bool:
         """
@@ -98,48 +116,119 @@ class RobotArm:
             return False
         
         # Safety check
-        if not self.safety_checker.is_pose_safe(pose):
+        violation = self.safety_checker.check_pose(pose)
+        if violation:
+            self.safety_checker.log_violation(violation, pose)
             print(f"Error: Pose {pose.name} failed safety check")
             return False
         
         # Check if smooth transition is safe
         if self.current_pose:
-            if not self.safety_checker.is_transition_safe(self.current_pose, pose):
+            violation = self.safety_checker.check_transition(self.current_pose, pose)
+            if violation:
+                self.safety_checker.log_violation(violation, pose, self.current_pose)
                 print(f"Error: Transition from {self.current_pose.name} to {pose.name} is unsafe")
                 return False
         
-        # Send manual mode command and set each joint
+        return self._send_pose(pose)
+    
+    def run_sequence(self, sequence) -> bool:
+        """
+        Execute a sequence of poses.
+        The whole sequence, including the move from the current pose, is
+        validated once up front, so the individual moves skip their checks.
+        
+        Args:
+            sequence: Iterable of poses (e.g. poses.SEQUENCE_TOWEL_FOLD)
+            
+        Returns:
+            True if every movement succeeded, False otherwise
+        """
+        if not self.is_connected:
+            print("Error: Not connected to robot arm")
+            return False
+        
+        sequence = list(sequence)
+        plan = [self.current_pose] + sequence if self.current_pose else sequence
+        failure = self.safety_checker.validate_sequence(plan)
+        if failure:
+            index, violation = failure
+            pose = plan[index]
+            self.safety_checker.log_violation(
+                violation, pose, plan[index - 1] if index else None)
+            print(f"Error: Sequence failed safety check at pose {pose.name}")
+            return False
+        
+        for pose in sequence:
+            if not self._send_pose(pose):
+                return False
+        return True
+    
+    def _send_pose(self, pose: Pose) -> bool:
+        """
+        Send an already validated pose to the Arduino.
+        
+        Args:
+            pose: Target pose configuration
+            
+        Returns:
+            True if movement successful, False otherwise
+        """
         try:
-            self.send_command('m')
-            time.sleep(0.2)
+            if self.vector_mode:
+                # The firmware replies once the servos have settled; the
+                # read returns as soon as the reply arrives
+                self.serial_conn.reset_input_buffer()
+                self.serial_conn.write(pose.payload)
+                self.serial_conn.timeout = self.POSE_TIMEOUT
+                try:
+                    response = self.serial_conn.read_until(b'\n', size=256)
+                finally:
+                    self.serial_conn.timeout = self.COMMAND_TIMEOUT
+                response = response.decode(errors='replace').strip()
+                if not response:
+                    # The arm may have moved part of the way
+                    self.current_pose = None
+                    print(f"Error: No reply to pose {pose.name}; "
+                          f"arm position unknown")
+                    return False
+                if response != "Pose set":
+                    # The firmware rejects a frame before moving any servo
+                    print(f"Error: Pose {pose.name} rejected by firmware: "
+                          f"{response}")
+                    return False
+            else:
+                # Send manual mode command and set each joint
+                self.send_command('m')
+                time.sleep(0.2)
             
-            # Set base position
-            command = f'b{pose.base}\n'
-            self.serial_conn.write(command.encode())
-            time.sleep(0.5)
+                # Set base position
+                command = f'b{pose.base}\n'
+                self.serial_conn.write(command.encode())
+                time.sleep(0.5)
             
-            # Set shoulder position
-            command = f's{pose.shoulder}\n'
-            self.serial_conn.write(command.encode())
-            time.sleep(0.5)
+                # Set shoulder position
+                command = f's{pose.shoulder}\n'
+                self.serial_conn.write(command.encode())
+                time.sleep(0.5)
             
-            # Set elbow position
-            command = f'e{pose.elbow}\n'
-            self.serial_conn.write(command.encode())
-            time.sleep(0.5)
+                # Set elbow position
+                command = f'e{pose.elbow}\n'
+                self.serial_conn.write(command.encode())
+                time.sleep(0.5)
             
-            # Set wrist position
-            command = f'w{pose.wrist}\n'
-            self.serial_conn.write(command.encode())
-            time.sleep(0.5)
+                # Set wrist position
+                command = f'w{pose.wrist}\n'
+                self.serial_conn.write(command.encode())
+                time.sleep(0.5)
             
-            # Set gripper position
-            command = f'g{pose.gripper}\n'
-            self.serial_conn.write(command.encode())
-            time.sleep(0.5)
+                # Set gripper position
+                command = f'g{pose.gripper}\n'
+                self.serial_conn.write(command.encode())
+                time.sleep(0.5)
             
-            # Exit manual mode
-            self.send_command('x')
+                # Exit manual mode
+                self.send_command('x')
             
             self.current_pose = pose
             print(f"Moved to pose: {pose.name}")
@@ -205,8 +294,15 @@ class RobotArm:
 
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Robot arm example")
+    parser.add_argument("--no-reset-wait", action="store_true",
+                        help="don't wait for the READY banner on connect")
+    args = parser.parse_args()
+    
     # Example usage
-    arm = RobotArm()
+    arm = RobotArm(reset_wait=not args.no_reset_wait)
     
     if arm.connect():
         print("Robot arm connected successfully")
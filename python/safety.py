@@ -3,10 +3,165 @@ Safety Module
 Implements safety checks and constraints for robot arm operations
 """
 
-from typing import Tuple, Optional
+from array import array
+from enum import IntEnum
+from functools import lru_cache
+from typing import List, Tuple, Optional
 import math
 
 
+class Violation(IntEnum):
+    """
+    Result of a pose or transition safety check.
+    NONE is zero, so any actual violation is truthy.
+    """
+    NONE = 0
+    BASE_RANGE = 1
+    SHOULDER_RANGE = 2
+    ELBOW_RANGE = 3
+    WRIST_RANGE = 4
+    GRIPPER_RANGE = 5
+    COLLISION = 6
+    BASE_CHANGE = 7
+    SHOULDER_CHANGE = 8
+    ELBOW_CHANGE = 9
+    WRIST_CHANGE = 10
+    GRIPPER_CHANGE = 11
+
+
+# Per-joint violations in poses.JOINT_NAMES order
+_RANGE_VIOLATIONS = (Violation.BASE_RANGE, Violation.SHOULDER_RANGE,
+                     Violation.ELBOW_RANGE, Violation.WRIST_RANGE,
+                     Violation.GRIPPER_RANGE)
+_CHANGE_VIOLATIONS = (Violation.BASE_CHANGE, Violation.SHOULDER_CHANGE,
+                      Violation.ELBOW_CHANGE, Violation.WRIST_CHANGE,
+                      Violation.GRIPPER_CHANGE)
+
+# Module-level aliases for the hot paths; Enum class attribute lookups are
+# comparatively slow
+_NONE = Violation.NONE
+_COLLISION = Violation.COLLISION
+_BASE_CHANGE, _SHOULDER_CHANGE, _ELBOW_CHANGE, _WRIST_CHANGE, _GRIPPER_CHANGE = (
+    _CHANGE_VIOLATIONS)
+
+
+# Indices into SafetyChecker statistics counters
+_COLLISIONS = 0
+_VIOLATIONS = 1
+
+
+def _count_violation(violation: Violation, counters) -> None:
+    """
+    Record a check result in a statistics counter array.
+    
+    Args:
+        violation: Result of a pose check
+        counters: Mutable integer array indexed by _COLLISIONS / _VIOLATIONS
+    """
+    if violation is _COLLISION:
+        counters[_COLLISIONS] += 1
+    elif violation:
+        counters[_VIOLATIONS] += 1
+
+
+def _in_zones(shoulder: int, elbow: int, zones) -> bool:
+    """Check shoulder/elbow angles against (s_min, s_max, e_min, e_max) zones."""
+    for shoulder_min, shoulder_max, elbow_min, elbow_max in zones:
+        if (shoulder_min <= shoulder <= shoulder_max and
+            elbow_min <= elbow <= elbow_max):
+            return True
+    return False
+
+
+def _check_joints(joints, limits, zones) -> Violation:
+    """
+    Pose safety kernel: range checks followed by the collision zone check.
+    Works on plain tuples only, so it can be swapped for a native
+    implementation without touching SafetyChecker.
+    
+    Args:
+        joints: Joint angles in poses.JOINT_NAMES order
+        limits: (min, max) pair per joint
+        zones: Collision zones as (s_min, s_max, e_min, e_max)
+        
+    Returns:
+        First Violation found, or Violation.NONE if the pose is safe
+    """
+    for violation, (min_val, max_val), angle in zip(_RANGE_VIOLATIONS, limits, joints):
+        if not min_val <= angle <= max_val:
+            return violation
+    
+    if _in_zones(joints[1], joints[2], zones):
+        return _COLLISION
+    
+    return _NONE
+
+
+def _check_changes(current, target, max_changes) -> Violation:
+    """
+    Transition safety kernel: per-joint change against its limit.
+    Not cached; five subtractions are cheaper than hashing two rows.
+    
+    Args:
+        current: Current pose (anything with the joint attributes)
+        target: Target pose
+        max_changes: Maximum change per joint in poses.JOINT_NAMES order
+        
+    Returns:
+        First Violation found, or Violation.NONE if the transition is safe
+    """
+    # Holding a pose is always a safe transition
+    if current is target:
+        return _NONE
+    
+    max_base, max_shoulder, max_elbow, max_wrist, max_gripper = max_changes
+    if abs(target.base - current.base) > max_base:
+        return _BASE_CHANGE
+    if abs(target.shoulder - current.shoulder) > max_shoulder:
+        return _SHOULDER_CHANGE
+    if abs(target.elbow - current.elbow) > max_elbow:
+        return _ELBOW_CHANGE
+    if abs(target.wrist - current.wrist) > max_wrist:
+        return _WRIST_CHANGE
+    if abs(target.gripper - current.gripper) > max_gripper:
+        return _GRIPPER_CHANGE
+    return _NONE
+
+
+# Cosine/sine for each whole degree. 0-360 covers shoulder + elbow for
+# any pose within the joint limits.
+_COS = tuple(math.cos(math.radians(deg)) for deg in range(361))
+_SIN = tuple(math.sin(math.radians(deg)) for deg in range(361))
+
+
+def _reach(shoulder: float, elbow: float,
+           l1: float, l2: float, l3: float) -> float:
+    """
+    Simple 2D reach of the arm for shoulder/elbow angles in degrees.
+    Whole-degree angles are looked up in _COS/_SIN; anything else
+    falls back to computing the trigonometry.
+    
+    Args:
+        shoulder: Shoulder angle
+        elbow: Elbow angle
+        l1, l2, l3: Shoulder, elbow and wrist link lengths
+        
+    Returns:
+        Distance from the base to the wrist tip
+    """
+    arm = shoulder + elbow
+    if type(arm) is int and 0 <= shoulder <= arm <= 360:
+        x = l1 * _COS[shoulder] + l2 * _COS[arm] + l3
+        y = l1 * _SIN[shoulder] + l2 * _SIN[arm]
+    else:
+        shoulder_rad = math.radians(shoulder)
+        arm_rad = math.radians(arm)
+        x = l1 * math.cos(shoulder_rad) + l2 * math.cos(arm_rad) + l3
+        y = l1 * math.sin(shoulder_rad) + l2 * math.sin(arm_rad)
+    
+    return math.sqrt(x * x + y * y)
+
+
 class SafetyChecker:
     """
     Safety checker for robot arm operations.
@@ -25,6 +180,11 @@ class SafetyChecker:
     GRIPPER_MIN = 10   # Open
     GRIPPER_MAX = 90   # Closed
     
+    # Display names in poses.JOINT_NAMES order
+    _JOINTS = ("Base", "Shoulder", "Elbow", "Wrist", "Gripper")
+    _LABELS = ("Base angle", "Shoulder angle", "Elbow angle",
+               "Wrist angle", "Gripper position")
+    
     # Maximum allowed change per transition (degrees)
     MAX_JOINT_CHANGE = 90
     
@@ -34,18 +194,75 @@ class SafetyChecker:
     WRIST_LENGTH = 5.0
     
     # Collision zones (combinations to avoid)
-    COLLISION_ZONES = [
+    # Immutable because check results are cached; override in a subclass
+    COLLISION_ZONES = (
         # (shoulder_min, shoulder_max, elbow_min, elbow_max)
         # Avoid positions where arm might hit base
         (15, 40, 0, 30),
-    ]
+    )
+    
+    # Pose checks read the joint limits and collision zones through per-class
+    # rows (_MIN, _MAX, _LIMITS) and a per-class cache, rebuilt for every
+    # subclass, so those constants can only be overridden in a subclass.
+    # MAX_JOINT_CHANGE is read on every transition check and can also be
+    # set on an instance.
+    _CLASS_ONLY = frozenset((
+        "BASE_MIN", "BASE_MAX", "SHOULDER_MIN", "SHOULDER_MAX",
+        "ELBOW_MIN", "ELBOW_MAX", "WRIST_MIN", "WRIST_MAX",
+        "GRIPPER_MIN", "GRIPPER_MAX", "COLLISION_ZONES",
+    ))
+    
+    @classmethod
+    def _build_rows(cls):
+        """Build the limit rows from the class constants."""
+        cls._MIN = (cls.BASE_MIN, cls.SHOULDER_MIN, cls.ELBOW_MIN,
+                    cls.WRIST_MIN, cls.GRIPPER_MIN)
+        cls._MAX = (cls.BASE_MAX, cls.SHOULDER_MAX, cls.ELBOW_MAX,
+                    cls.WRIST_MAX, cls.GRIPPER_MAX)
+        cls._LIMITS = tuple(zip(cls._MIN, cls._MAX))
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._build_rows()
+    
+    def __setattr__(self, name, value):
+        # Refuse rather than silently ignore an instance-level limit
+        if name in self._CLASS_ONLY:
+            raise AttributeError(
+                f"{name} is a class-level limit; override it in a subclass")
+        super().__setattr__(name, value)
+    
+    @property
+    def _max_changes(self) -> tuple:
+        """Per-joint transition limits; the gripper is not limited."""
+        limit = self.MAX_JOINT_CHANGE
+        return (limit, limit, limit, limit, math.inf)
     
     def __init__(self):
         """Initialize safety checker."""
-        self.collision_count = 0
-        self.safety_violation_count = 0
+        # Statistics counters, indexed by _COLLISIONS / _VIOLATIONS
+        self._counters = array('q', [0, 0])
+    
+    @property
+    def collision_count(self) -> int:
+        """Number of poses rejected for entering a collision zone."""
+        return self._counters[_COLLISIONS]
+    
+    @collision_count.setter
+    def collision_count(self, value: int):
+        self._counters[_COLLISIONS] = value
+    
+    @property
+    def safety_violation_count(self) -> int:
+        """Number of poses rejected for joint limit violations."""
+        return self._counters[_VIOLATIONS]
+    
+    @safety_violation_count.setter
+    def safety_violation_count(self, value: int):
+        self._counters[_VIOLATIONS] = value
     
-    def is_angle_in_range(self, angle: float, min_val: float, max_val: float) -> bool:
+    @staticmethod
+    def is_angle_in_range(angle: float, min_val: float, max_val: float) -> bool:
         """
         Check if angle is within allowed range.
         
@@ -59,6 +276,22 @@ class SafetyChecker:
         """
         return min_val <= angle <= max_val
     
+    def check_pose(self, pose) -> Violation:
+        """
+        Validate a pose and update the safety statistics.
+        Nothing is printed; pass a failing result to log_violation.
+        
+        Args:
+            pose: Pose object to validate
+            
+        Returns:
+            Violation found, or Violation.NONE if the pose is safe
+        """
+        violation = self._pose_violation(pose.joints)
+        if violation is not _NONE:
+            _count_violation(violation, self._counters)
+        return violation
+    
     def is_pose_safe(self, pose) -> bool:
         """
         Check if a pose is safe.
@@ -69,44 +302,87 @@ class SafetyChecker:
         Returns:
             True if pose is safe, False otherwise
         """
-        # Check each joint is within limits
-        if not self.is_angle_in_range(pose.base, self.BASE_MIN, self.BASE_MAX):
-            print(f"Safety violation: Base angle {pose.base} out of range "
-                  f"[{self.BASE_MIN}, {self.BASE_MAX}]")
-            self.safety_violation_count += 1
-            return False
-        
-        if not self.is_angle_in_range(pose.shoulder, self.SHOULDER_MIN, self.SHOULDER_MAX):
-            print(f"Safety violation: Shoulder angle {pose.shoulder} out of range "
-                  f"[{self.SHOULDER_MIN}, {self.SHOULDER_MAX}]")
-            self.safety_violation_count += 1
-            return False
+        # Same as check_pose, inlined for the common safe case
+        violation = self._pose_violation(pose.joints)
+        if violation is _NONE:
+            return True
+        _count_violation(violation, self._counters)
+        return False
+    
+    def is_pose_safe_batch(self, rows) -> List[bool]:
+        """
+        Check a batch of joint rows in one call.
+        Intended for validating whole sequences while planning, so
+        violations are not counted in the statistics.
         
-        if not self.is_angle_in_range(pose.elbow, self.ELBOW_MIN, self.ELBOW_MAX):
-            print(f"Safety violation: Elbow angle {pose.elbow} out of range "
-                  f"[{self.ELBOW_MIN}, {self.ELBOW_MAX}]")
-            self.safety_violation_count += 1
-            return False
+        Args:
+            rows: Iterable of joint tuples (see poses.POSE_TABLE)
+            
+        Returns:
+            List with True for each safe row, False otherwise
+        """
+        return [violation is _NONE for violation in self.check_sequence(rows)]
+    
+    def check_sequence(self, rows) -> List[Violation]:
+        """
+        Run the pose safety kernel over a whole plan of joint rows.
+        Violations are not counted in the statistics.
         
-        if not self.is_angle_in_range(pose.wrist, self.WRIST_MIN, self.WRIST_MAX):
-            print(f"Safety violation: Wrist angle {pose.wrist} out of range "
-                  f"[{self.WRIST_MIN}, {self.WRIST_MAX}]")
-            self.safety_violation_count += 1
-            return False
+        Args:
+            rows: Iterable of joint tuples (see poses.POSE_TABLE)
+            
+        Returns:
+            List with the Violation for each row (Violation.NONE if safe)
+        """
+        limits, zones = self._LIMITS, self.COLLISION_ZONES
+        return [_check_joints(row, limits, zones) for row in rows]
+    
+    def validate_sequence(self, poses) -> Optional[Tuple[int, Violation]]:
+        """
+        Validate every pose and every transition of a sequence in one pass.
+        Violations are not counted in the statistics.
         
-        if not self.is_angle_in_range(pose.gripper, self.GRIPPER_MIN, self.GRIPPER_MAX):
-            print(f"Safety violation: Gripper position {pose.gripper} out of range "
-                  f"[{self.GRIPPER_MIN}, {self.GRIPPER_MAX}]")
-            self.safety_violation_count += 1
-            return False
+        Args:
+            poses: Sequence of Pose objects in execution order
+            
+        Returns:
+            None if the whole sequence is safe, otherwise a tuple of
+            (index of the failing pose, Violation). Transition violations
+            are reported at the pose being moved to.
+        """
+        limits, zones = self._LIMITS, self.COLLISION_ZONES
+        max_changes = self._max_changes
+        previous = None
+        for index, pose in enumerate(poses):
+            violation = _check_joints(pose.joints, limits, zones)
+            if violation is _NONE and previous is not None:
+                violation = _check_changes(previous, pose, max_changes)
+            if violation is not _NONE:
+                return index, violation
+            previous = pose
         
-        # Check for collision zones
-        if self.is_in_collision_zone(pose):
-            print(f"Safety violation: Pose {pose.name} is in collision zone")
-            self.collision_count += 1
-            return False
+        return None
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _pose_violation(cls, joints: tuple) -> Violation:
+        """
+        Find the first limit a row of joint angles violates.
+        The result only depends on the angles, so it is cached; statistics
+        are handled by the callers.
         
-        return True
+        Args:
+            joints: Joint angles in poses.JOINT_NAMES order
+            
+        Returns:
+            Violation found, or Violation.NONE if the pose is safe
+        """
+        return _check_joints(joints, cls._LIMITS, cls.COLLISION_ZONES)
+    
+    @classmethod
+    def _in_collision(cls, shoulder: int, elbow: int) -> bool:
+        """Check raw shoulder/elbow angles against the collision zones."""
+        return _in_zones(shoulder, elbow, cls.COLLISION_ZONES)
     
     def is_in_collision_zone(self, pose) -> bool:
         """
@@ -118,12 +394,21 @@ class SafetyChecker:
         Returns:
             True if pose is in collision zone, False otherwise
         """
-        for zone in self.COLLISION_ZONES:
-            shoulder_min, shoulder_max, elbow_min, elbow_max = zone
-            if (shoulder_min <= pose.shoulder <= shoulder_max and
-                elbow_min <= pose.elbow <= elbow_max):
-                return True
-        return False
+        return self._in_collision(pose.shoulder, pose.elbow)
+    
+    def check_transition(self, current_pose, target_pose) -> Violation:
+        """
+        Validate the joint changes between two poses.
+        Nothing is printed; pass a failing result to log_violation.
+        
+        Args:
+            current_pose: Current pose
+            target_pose: Target pose
+            
+        Returns:
+            Violation found, or Violation.NONE if the transition is safe
+        """
+        return _check_changes(current_pose, target_pose, self._max_changes)
     
     def is_transition_safe(self, current_pose, target_pose) -> bool:
         """
@@ -136,31 +421,29 @@ class SafetyChecker:
         Returns:
             True if transition is safe, False otherwise
         """
-        # Calculate change in each joint
-        base_change = abs(target_pose.base - current_pose.base)
-        shoulder_change = abs(target_pose.shoulder - current_pose.shoulder)
-        elbow_change = abs(target_pose.elbow - current_pose.elbow)
-        wrist_change = abs(target_pose.wrist - current_pose.wrist)
-        gripper_change = abs(target_pose.gripper - current_pose.gripper)
-        
-        # Check if any single joint change is too large
-        if base_change > self.MAX_JOINT_CHANGE:
-            print(f"Unsafe transition: Base change of {base_change}° exceeds max {self.MAX_JOINT_CHANGE}°")
-            return False
-        
-        if shoulder_change > self.MAX_JOINT_CHANGE:
-            print(f"Unsafe transition: Shoulder change of {shoulder_change}° exceeds max {self.MAX_JOINT_CHANGE}°")
-            return False
-        
-        if elbow_change > self.MAX_JOINT_CHANGE:
-            print(f"Unsafe transition: Elbow change of {elbow_change}° exceeds max {self.MAX_JOINT_CHANGE}°")
-            return False
-        
-        if wrist_change > self.MAX_JOINT_CHANGE:
-            print(f"Unsafe transition: Wrist change of {wrist_change}° exceeds max {self.MAX_JOINT_CHANGE}°")
-            return False
+        return _check_changes(current_pose, target_pose, self._max_changes) is _NONE
+    
+    def log_violation(self, violation: Violation, pose, current_pose=None):
+        """
+        Print a message describing a violation.
         
-        return True
+        Args:
+            violation: Result of check_pose or check_transition
+            pose: Pose that was checked (the target for transitions)
+            current_pose: Starting pose, for transition violations
+        """
+        if violation in _RANGE_VIOLATIONS:
+            index = _RANGE_VIOLATIONS.index(violation)
+            min_val, max_val = self._LIMITS[index]
+            print(f"Safety violation: {self._LABELS[index]} "
+                  f"{pose.joints[index]} out of range [{min_val}, {max_val}]")
+        elif violation is Violation.COLLISION:
+            print(f"Safety violation: Pose {pose.name} is in collision zone")
+        elif violation in _CHANGE_VIOLATIONS:
+            index = _CHANGE_VIOLATIONS.index(violation)
+            change = abs(pose.joints[index] - current_pose.joints[index])
+            print(f"Unsafe transition: {self._JOINTS[index]} change of {change}° "
+                  f"exceeds max {self.MAX_JOINT_CHANGE}°")
     
     def calculate_reach(self, pose) -> float:
         """
@@ -173,20 +456,21 @@ class SafetyChecker:
         Returns:
             Approximate reach distance in arbitrary units
         """
-        # Simplified kinematic calculation using class constants
-        shoulder_rad = math.radians(pose.shoulder)
-        elbow_rad = math.radians(pose.elbow)
-        
-        # Simple 2D reach calculation
-        x = (self.SHOULDER_LENGTH * math.cos(shoulder_rad) +
-             self.ELBOW_LENGTH * math.cos(shoulder_rad + elbow_rad) +
-             self.WRIST_LENGTH)
-        
-        y = (self.SHOULDER_LENGTH * math.sin(shoulder_rad) +
-             self.ELBOW_LENGTH * math.sin(shoulder_rad + elbow_rad))
+        return _reach(pose.shoulder, pose.elbow, self.SHOULDER_LENGTH,
+                      self.ELBOW_LENGTH, self.WRIST_LENGTH)
+    
+    def calculate_reach_batch(self, rows) -> List[float]:
+        """
+        Calculate reach for a batch of joint rows, e.g. a whole sequence.
         
-        reach = math.sqrt(x**2 + y**2)
-        return reach
+        Args:
+            rows: Iterable of joint tuples (see poses.POSE_TABLE)
+            
+        Returns:
+            List of reach distances, one per row
+        """
+        l1, l2, l3 = self.SHOULDER_LENGTH, self.ELBOW_LENGTH, self.WRIST_LENGTH
+        return [_reach(row[1], row[2], l1, l2, l3) for row in rows]
     
     def get_safety_stats(self) -> dict:
         """
@@ -202,8 +486,11 @@ class SafetyChecker:
     
     def reset_stats(self):
         """Reset safety statistics."""
-        self.collision_count = 0
-        self.safety_violation_count = 0
+        self._counters[_COLLISIONS] = 0
+        self._counters[_VIOLATIONS] = 0
+
+
+SafetyChecker._build_rows()
 
 
 # Emergency safety limits for critical scenarios
@@ -211,8 +498,53 @@ EMERGENCY_LIMITS = {
     "max_speed": 50,  # Maximum speed in degrees/second
     "min_clearance": 5,  # Minimum clearance from obstacles in cm
     "max_force": 10,  # Maximum force in Newtons
+    "max_temperature": 70,  # Maximum motor temperature in Celsius
 }
 
+# Fixed sensor vector layout used by check_emergency_vector
+SENSOR_FIELDS = ("distance", "force", "temperature")
+
+# Limits bound once at import for the per-call checks
+_MIN_CLEARANCE = EMERGENCY_LIMITS["min_clearance"]
+_MAX_FORCE = EMERGENCY_LIMITS["max_force"]
+_MAX_TEMPERATURE = EMERGENCY_LIMITS["max_temperature"]
+
+# Per-field bounds and messages in SENSOR_FIELDS order
+_SENSOR_LOW = (_MIN_CLEARANCE, -math.inf, -math.inf)
+_SENSOR_HIGH = (math.inf, _MAX_FORCE, _MAX_TEMPERATURE)
+_SENSOR_MESSAGES = (
+    "Obstacle detected at {}cm",
+    "Excessive force detected: {}N",
+    "Motor overheating: {}°C",
+)
+_DISTANCE_MESSAGE, _FORCE_MESSAGE, _TEMPERATURE_MESSAGE = _SENSOR_MESSAGES
+
+
+def check_emergency_vector(sensor_vec) -> Tuple[bool, Optional[str]]:
+    """
+    Check for emergency conditions in a fixed-layout sensor vector.
+    
+    Args:
+        sensor_vec: Sequence with one reading per SENSOR_FIELDS entry,
+            in that order, with NaN for readings that were not reported;
+            any other length is rejected
+        
+    Returns:
+        Tuple of (is_safe, error_message)
+    """
+    # A short vector would silently skip the trailing checks
+    if len(sensor_vec) != len(SENSOR_FIELDS):
+        return False, (f"Expected {len(SENSOR_FIELDS)} sensor readings, "
+                       f"got {len(sensor_vec)}")
+    
+    # NaN compares False against both bounds, so missing readings pass
+    for value, low, high, message in zip(sensor_vec, _SENSOR_LOW,
+                                         _SENSOR_HIGH, _SENSOR_MESSAGES):
+        if value < low or value > high:
+            return False, message.format(value)
+    
+    return True, None
+
 
 def check_emergency_conditions(sensor_data: dict) -> Tuple[bool, Optional[str]]:
     """
@@ -225,19 +557,19 @@ def check_emergency_conditions(sensor_data: dict) -> Tuple[bool, Optional[str]]:
         Tuple of (is_safe, error_message)
     """
     # Check for obstacle detection
-    if "distance" in sensor_data:
-        if sensor_data["distance"] < EMERGENCY_LIMITS["min_clearance"]:
-            return False, f"Obstacle detected at {sensor_data['distance']}cm"
+    distance = sensor_data.get("distance")
+    if distance is not None and distance < _MIN_CLEARANCE:
+        return False, _DISTANCE_MESSAGE.format(distance)
     
     # Check for excessive force
-    if "force" in sensor_data:
-        if sensor_data["force"] > EMERGENCY_LIMITS["max_force"]:
-            return False, f"Excessive force detected: {sensor_data['force']}N"
+    force = sensor_data.get("force")
+    if force is not None and force > _MAX_FORCE:
+        return False, _FORCE_MESSAGE.format(force)
     
     # Check for over-temperature
-    if "temperature" in sensor_data:
-        if sensor_data["temperature"] > 70:  # Celsius
-            return False, f"Motor overheating: {sensor_data['temperature']}°C"
+    temperature = sensor_data.get("temperature")
+    if temperature is not None and temperature > _MAX_TEMPERATURE:
+        return False, _TEMPERATURE_MESSAGE.format(temperature)
     
     return True, None
 